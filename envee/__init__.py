@@ -1,5 +1,19 @@
 __version__ = "0.2.0"
 
-from envee.envee import NamingStrategy, environment, field, read
+from envee.envee import (
+    NamingStrategy,
+    environment,
+    field,
+    invalidate,
+    read,
+    read_cached,
+)
 
-__all__ = ["read", "environment", "field", "NamingStrategy"]
+__all__ = [
+    "read",
+    "read_cached",
+    "invalidate",
+    "environment",
+    "field",
+    "NamingStrategy",
+]
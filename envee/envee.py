@@ -1,26 +1,39 @@
 from __future__ import annotations
 
 import dataclasses
+import functools
 import os
-import shlex
+import re
 import sys
+import threading
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from typing import (
+    TYPE_CHECKING,
     Any,
     Optional,
     Type,
     TypeVar,
     Union,
+    cast,
     get_args,
     get_origin,
     get_type_hints,
 )
 
-if sys.version_info < (3, 11):
+if sys.version_info >= (3, 11):
+    from typing import dataclass_transform
+elif TYPE_CHECKING:
     from typing_extensions import dataclass_transform
 else:
-    from typing import dataclass_transform
+    # dataclass_transform only carries information for static type checkers,
+    # so avoid importing typing_extensions at runtime on older Pythons
+    def dataclass_transform(**kwargs: Any) -> Callable[[_T], _T]:
+        def decorator(obj: _T) -> _T:
+            return obj
+
+        return decorator
 if sys.version_info < (3, 10):
     UnionType = Union
 else:
@@ -36,8 +49,21 @@ _T = TypeVar(
 
 ENVEE_METADATA_KEY = "envee"
 
+if sys.version_info >= (3, 10):
+    # Slotted instances are smaller and have faster attribute access
+    _DATACLASS_OPTIONS = {"frozen": True, "slots": True}
+else:
+    _DATACLASS_OPTIONS = {"frozen": True}
+
 
 class NamingStrategy(ABC):
+    """Strategy to derive environment variable and file names from field names
+
+    Implementations must be pure functions of the field name: the derived
+    names are resolved once per class and cached, not re-evaluated on every
+    :func:`read` call.
+    """
+
     @staticmethod
     @abstractmethod
     def get_env_variable_name(field_name: str) -> str:
@@ -59,6 +85,18 @@ class DefaultNamingStrategy(NamingStrategy):
         return field_name.lower()
 
 
+# Matches KEY=VALUE lines with an optional export prefix. Values may be
+# quoted with single or double quotes (double quoted values may span multiple
+# lines and escape quotes and backslashes) and lines may end with a # comment.
+_DOTENV_RE = re.compile(
+    r"(?m)^[ \t]*(?:export[ \t]+)?([A-Za-z_][A-Za-z0-9_]*)[ \t]*="
+    r"[ \t]*(?:\"((?:[^\"\\]|\\.)*)\"|'([^']*)'|([^#\n]*?))[ \t]*(?:#[^\n]*)?$"
+)
+
+# Backslash escapes allowed inside double quoted values
+_DOTENV_UNESCAPE_RE = re.compile(r"\\([\\\"])")
+
+
 def _parse_dotenv(dotenv_file_path: str) -> dict[str, str]:
     """Parse a .env file into a dict
 
@@ -73,21 +111,94 @@ def _parse_dotenv(dotenv_file_path: str) -> dict[str, str]:
         The parsed key value pairs
     """
     vars: dict[str, str] = {}
-    with open(dotenv_file_path) as f:
-        dotenv = f.read()
-        s = shlex.shlex(dotenv, posix=True)
-        parts = list(s)
-        for index, elem in enumerate(parts):
-            if elem == "=":
-                if 0 < index < len(parts):
-                    if len(parts[index - 1]) > 0:
-                        key = parts[index - 1]
-                        value = parts[index + 1]
-                        vars[key] = value
+    dotenv = _read_small_file(dotenv_file_path)
+    if dotenv is None:
+        return vars
+    # The raw read skips universal-newline translation, so normalize CRLF
+    # and lone CR line endings like text-mode open() would; otherwise bare
+    # values would keep a trailing \r
+    dotenv = dotenv.replace("\r\n", "\n").replace("\r", "\n")
+    for match in _DOTENV_RE.finditer(dotenv):
+        double_quoted, single_quoted, bare = match.group(2, 3, 4)
+        if double_quoted is not None:
+            value = _DOTENV_UNESCAPE_RE.sub(r"\1", double_quoted)
+        elif single_quoted is not None:
+            value = single_quoted
+        else:
+            value = bare
+        vars[match.group(1)] = value
+    return vars
+
+
+def _read_small_file(file_path: str) -> Optional[str]:
+    """Read a small file with raw os calls
+
+    Secret files are typically only a few bytes, so the buffered text I/O
+    stack costs more to set up than the read itself. Use os.open/os.read
+    and decode once.
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the file to read
+
+    Returns
+    -------
+    Optional[str]
+        The stripped file content, or None if the file does not exist
+    """
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except FileNotFoundError:
+        return None
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, 8192)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks).strip().decode()
+
+
+_DOTENV_CACHE: dict[str, tuple[int, int, dict[str, str]]] = {}
+
+
+def _load_dotenv(dotenv_file_path: str) -> Optional[dict[str, str]]:
+    """Load a .env file, reusing the parsed result while the file is unchanged
+
+    The cache is keyed by path and invalidated via the file's mtime and size,
+    so repeated :func:`read` calls do not reparse an unmodified file.
+
+    Parameters
+    ----------
+    dotenv_file_path : str
+        The path to the .env file
+
+    Returns
+    -------
+    Optional[dict[str, str]]
+        The parsed key value pairs, or None if the file does not exist
+    """
+    try:
+        stat = os.stat(dotenv_file_path)
+    except OSError:
+        return None
+    cached = _DOTENV_CACHE.get(dotenv_file_path)
+    if (
+        cached is not None
+        and cached[0] == stat.st_mtime_ns
+        and cached[1] == stat.st_size
+    ):
+        return cached[2]
+    vars = _parse_dotenv(dotenv_file_path)
+    _DOTENV_CACHE[dotenv_file_path] = (stat.st_mtime_ns, stat.st_size, vars)
     return vars
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(**_DATACLASS_OPTIONS)
 class _FieldMetadata:
     file_location: Optional[str] = None
     file_name: Optional[str] = None
@@ -164,6 +275,132 @@ def field(
     )
 
 
+@dataclasses.dataclass(**_DATACLASS_OPTIONS)
+class _FieldPlan:
+    """Precomputed per-field information used by :func:`read`"""
+
+    name: str
+    type: Any
+    is_optional: bool
+    read_env: bool
+    read_file: bool
+    has_default: bool
+    default: Any
+    default_factory: Optional[Callable[[], Any]]
+    env_key: str
+    dotenv_key: str
+    file_path: Optional[str]
+    file_name: str
+    converter: Callable[[str], Any]
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_plan(
+    cls: type, naming_strategy: Type[NamingStrategy]
+) -> tuple[_FieldPlan, ...]:
+    """Compile the field plan for a dataclass
+
+    Resolves the type hints, Optional[X] unwrapping, field metadata and the
+    environment variable and file names once per class, so repeated
+    :func:`read` calls do not pay for the typing introspection and string
+    work again.
+
+    Parameters
+    ----------
+    cls : type
+        The dataclass to compile the plan for
+    naming_strategy : Type[NamingStrategy]
+        The naming strategy used to derive environment variable and file names
+
+    Returns
+    -------
+    tuple[_FieldPlan, ...]
+        The precomputed plan entries, one per field
+    """
+    fields = dataclasses.fields(cls)
+
+    # get_type_hints evaluates string annotations and merges the MRO, which
+    # is only needed for postponed evaluation or inherited fields. Otherwise
+    # the raw annotations already contain the type objects.
+    types: dict[str, Any] = dict(cls.__annotations__)
+    if any(isinstance(annotation, str) for annotation in types.values()) or any(
+        field_.name not in types for field_ in fields
+    ):
+        types = get_type_hints(cls)
+
+    plan: list[_FieldPlan] = []
+    for field_ in fields:
+        field_type = types[field_.name]
+
+        if field_type == Ellipsis:
+            field_type = str
+
+        # Handle Optional[X] case
+        if is_optional_type(field_type):
+            type_ = get_type_of_optional(field_type)
+            is_optional = True
+        else:
+            type_ = field_type
+            is_optional = False
+
+        # Field Metadata
+        if ENVEE_METADATA_KEY in field_.metadata:
+            field_metadata: _FieldMetadata = field_.metadata[ENVEE_METADATA_KEY]
+        else:
+            field_metadata = _FieldMetadata()
+
+        # Resolve environment variable, dotenv and file names
+        default_key = naming_strategy.get_env_variable_name(field_.name)
+        env_key = field_metadata.env_name or default_key
+        dotenv_key = field_metadata.dotenv_name or default_key
+        file_name = field_metadata.file_name or naming_strategy.get_file_name(
+            field_.name
+        )
+        # Normalize possibly path-like metadata to plain strings once
+        if field_metadata.file_path:
+            file_path: Optional[str] = os.fspath(field_metadata.file_path)
+        elif field_metadata.file_location:
+            file_path = os.path.join(os.fspath(field_metadata.file_location), file_name)
+        else:
+            file_path = None
+
+        # Resolve the conversion function
+        if field_metadata.conversion_func is not None:
+            converter: Callable[[str], Any] = field_metadata.conversion_func
+        elif type_ in PRIMITIVE_TYPES:
+            converter = type_
+        elif type_ == bool:
+            converter = default_parse_bool_func
+        else:
+            converter = functools.partial(_raise_not_convertible, field_.name)
+
+        # Resolve defaults once; MISSING is a sentinel, compare by identity
+        has_default = field_.default is not dataclasses.MISSING
+        if field_.default_factory is not dataclasses.MISSING:
+            default_factory: Optional[Callable[[], Any]] = field_.default_factory
+        else:
+            default_factory = None
+
+        plan.append(
+            _FieldPlan(
+                name=field_.name,
+                type=type_,
+                is_optional=is_optional,
+                read_env=field_metadata.use_env,
+                read_file=field_metadata.use_file,
+                has_default=has_default,
+                default=field_.default if has_default else None,
+                default_factory=default_factory,
+                env_key=env_key,
+                dotenv_key=dotenv_key,
+                file_path=file_path,
+                file_name=file_name,
+                converter=converter,
+            )
+        )
+    return tuple(plan)
+
+
 @dataclass_transform(kw_only_default=True, field_specifiers=(field,))
 def environment(cls: _T, **kwargs: Any) -> _T:
     if sys.version_info >= (3, 10):
@@ -171,7 +408,25 @@ def environment(cls: _T, **kwargs: Any) -> _T:
             kwargs = {"kw_only": True}
         else:
             kwargs["kw_only"] = True
-    return dataclasses.dataclass(**kwargs)(cls)  # type: ignore
+        # Slotted instances are smaller and have faster attribute access
+        kwargs.setdefault("slots", True)
+    new_cls = dataclasses.dataclass(**kwargs)(cls)  # type: ignore
+    try:
+        # Warm the plan cache for the default naming strategy so the cost is
+        # paid at decoration time instead of the first read
+        _compile_plan(new_cls, DefaultNamingStrategy)  # type: ignore
+    except Exception:
+        # Errors (e.g. unresolvable annotations) surface at read() as before
+        pass
+    return new_cls  # type: ignore
+
+
+def _raise_not_convertible(field_name: str, value: str) -> Any:
+    """Converter used for types that require an explicit conversion_func"""
+    raise RuntimeError(
+        "Not possible to convert type. "
+        f"Please specify conversion_func for field '{field_name}'."
+    )
 
 
 def is_optional_type(field_type: Any) -> bool:
@@ -191,11 +446,23 @@ def get_type_of_optional(field_type: Any) -> Any:
     return next(iter(optional_types))
 
 
+_BOOL_TRUE_VALUES = frozenset(("true", "1"))
+_BOOL_FALSE_VALUES = frozenset(("false", "0"))
+# Common spellings matched without the lowercasing allocation
+_BOOL_TRUE_LITERALS = frozenset(("true", "True", "1"))
+_BOOL_FALSE_LITERALS = frozenset(("false", "False", "0"))
+
+
 def default_parse_bool_func(value: str) -> bool:
     """Default function to parse bool values"""
-    if value.lower() in ("true", "1"):
+    if value in _BOOL_TRUE_LITERALS:
         return True
-    if value.lower() in ("false", "0"):
+    if value in _BOOL_FALSE_LITERALS:
+        return False
+    lowered = value.lower()
+    if lowered in _BOOL_TRUE_VALUES:
+        return True
+    if lowered in _BOOL_FALSE_VALUES:
         return False
     raise RuntimeError(f"Can't parse {value} as bool.")
 
@@ -231,108 +498,87 @@ def read(
         When an error occurred while reading the data
     """
 
-    # Parse dotenv file
-    dotenv = None
-    if dotenv_path is not None and os.path.exists(dotenv_path):
-        dotenv = _parse_dotenv(dotenv_path)
+    # Normalize possibly path-like arguments to plain strings once
+    default_files_location = os.fspath(default_files_location)
+    if dotenv_path is not None:
+        dotenv_path = os.fspath(dotenv_path)
 
-    init_kwargs = {}
-    types = get_type_hints(cls)
-
-    for field in dataclasses.fields(cls):  # type: ignore
-        field_name = field.name
-        field_type = types[field.name]
+    # Bind the environment lookup once instead of going through the os module
+    # and the environ proxy per field
+    environ_get = os.environ.get
 
-        if field_type == Ellipsis:
-            field_type = str
+    # Parse dotenv file
+    dotenv = None
+    if dotenv_path is not None:
+        dotenv = _load_dotenv(dotenv_path)
+    # Bind the lookup once so the loop skips the dotenv block entirely when
+    # no dotenv file is used
+    dotenv_get = dotenv.get if dotenv is not None else None
 
-        # Handle Optional[X] case
-        if is_optional_type(field_type):
-            type_ = get_type_of_optional(field_type)
-        else:
-            type_ = field_type
+    # File names in default_files_location, scanned once on first use instead
+    # of calling os.path.exists once per field
+    default_location_files: Optional[set[str]] = None
 
-        # Field Metadata
-        if ENVEE_METADATA_KEY in field.metadata:
-            field_metadata: _FieldMetadata = field.metadata[ENVEE_METADATA_KEY]
-        else:
-            field_metadata = _FieldMetadata()
+    init_kwargs = {}
 
-        # Determine if files or environment should be used
-        read_file = True and field_metadata.use_file
-        read_env = True and field_metadata.use_env
+    for field_plan in _compile_plan(cls, naming_strategy):  # type: ignore
+        field_name = field_plan.name
 
         raw_value = None
         value = None
         # Read from file
-        if read_file:
-            if field_metadata.file_path:
-                file_path = field_metadata.file_path
+        if field_plan.read_file:
+            if field_plan.file_path is not None:
+                file_path: Optional[str] = field_plan.file_path
+            elif os.sep in field_plan.file_name:
+                # File names pointing into subdirectories are not visible in
+                # the flat directory scan; probe the joined path directly
+                file_path = os.path.join(default_files_location, field_plan.file_name)
             else:
-                if field_metadata.file_location:
-                    location = field_metadata.file_location
-                else:
-                    location = default_files_location
-
-                if field_metadata.file_name:
-                    file_name = field_metadata.file_name
+                if default_location_files is None:
+                    try:
+                        default_location_files = {
+                            entry.name for entry in os.scandir(default_files_location)
+                        }
+                    except OSError:
+                        default_location_files = set()
+                if field_plan.file_name in default_location_files:
+                    file_path = os.path.join(
+                        default_files_location, field_plan.file_name
+                    )
                 else:
-                    file_name = naming_strategy.get_file_name(field_name)
-
-                file_path = os.path.join(location, file_name)
+                    file_path = None
 
-            if os.path.exists(file_path):
-                with open(file_path) as f:
-                    raw_value = f.read().strip()
+            if file_path is not None:
+                raw_value = _read_small_file(file_path)
 
         # Read from dotenv
-        if dotenv is not None and raw_value is None:
-            if field_metadata.dotenv_name:
-                dotenv_key = field_metadata.dotenv_name
-            else:
-                dotenv_key = naming_strategy.get_env_variable_name(field_name)
-            if dotenv_key in dotenv:
-                raw_value = dotenv[dotenv_key]
+        if dotenv_get is not None and raw_value is None:
+            raw_value = dotenv_get(field_plan.dotenv_key)
 
         # Read from environment
-        if read_env:
+        if field_plan.read_env:
             if raw_value is None:
-                if field_metadata.env_name:
-                    environ_key = field_metadata.env_name
-                else:
-                    environ_key = naming_strategy.get_env_variable_name(field_name)
-                if environ_key in os.environ:
-                    raw_value = os.environ[environ_key]
+                raw_value = environ_get(field_plan.env_key)
 
         # Convert raw values
         if raw_value is not None:
             try:
-                if field_metadata.conversion_func is not None:
-                    value = field_metadata.conversion_func(raw_value)
-                elif type_ in PRIMITIVE_TYPES:
-                    value = type_(raw_value)
-                elif type_ == bool:
-                    value = default_parse_bool_func(raw_value)
-                elif type_ == Ellipsis:
-                    value = str(raw_value)
-                else:
-                    raise RuntimeError(
-                        "Not possible to convert type. "
-                        f"Please specify conversion_func for field '{field.name}'."
-                    )
+                value = field_plan.converter(raw_value)
             except Exception as e:
                 raise RuntimeError(
-                    f"Failed to convert value for field {field.name}: {e}"
+                    f"Failed to convert value for field {field_name}: {e}"
                 )
 
         # Use default value if None was previously found
-        if value is None and not field.default == dataclasses.MISSING:
-            value = field.default
-        elif value is None and not field.default_factory == dataclasses.MISSING:
-            value = field.default_factory()
+        if value is None:
+            if field_plan.has_default:
+                value = field_plan.default
+            elif field_plan.default_factory is not None:
+                value = field_plan.default_factory()
 
         # Check if value is required and is not defined as Optional
-        if value is None and not is_optional_type(field_type):
+        if value is None and not field_plan.is_optional:
             raise RuntimeError(
                 f"Field '{field_name}' is required but no value was found."
             )
@@ -340,3 +586,69 @@ def read(
         init_kwargs[field_name] = value
 
     return cls(**init_kwargs)
+
+
+_READ_CACHE: dict[tuple[Any, ...], tuple[float, Any]] = {}
+_READ_CACHE_LOCK = threading.Lock()
+
+
+def read_cached(
+    cls: Type[_T],
+    *,
+    ttl: float = 5.0,
+    default_files_location: str = "/run/secrets",
+    dotenv_path: Optional[str] = None,
+    naming_strategy: Type[NamingStrategy] = DefaultNamingStrategy,
+) -> _T:
+    """Read configurations like :func:`read`, reusing a recent result
+
+    For applications that read the same configuration repeatedly, the last
+    result per (class, arguments) combination is reused for ttl seconds
+    before the environment and files are consulted again. Use
+    :func:`invalidate` to drop the cached results explicitly, e.g. after a
+    secrets rotation.
+
+    Parameters
+    ----------
+    cls : Type[T]
+        A dataclass specifying the configuration to read
+    ttl : float, optional
+        How many seconds a cached result stays fresh, by default 5.0
+    default_files_location : str, optional
+        The location where files are searched, by default "/run/secrets"
+    dotenv_path : Optional[str], optional
+        The path to a .env file, by default None
+    naming_strategy: Type[NamingStrategy]
+        The naming strategy to be used for environment variables and files
+
+    Returns
+    -------
+    T
+        The dataclass filled with data from the environment or files
+
+    Raises
+    ------
+    RuntimeError
+        When an error occurred while reading the data
+    """
+    key = (cls, default_files_location, dotenv_path, naming_strategy)
+    now = time.monotonic()
+    with _READ_CACHE_LOCK:
+        cached = _READ_CACHE.get(key)
+        if cached is not None and now - cached[0] < ttl:
+            return cast(_T, cached[1])
+    value = read(
+        cls,
+        default_files_location=default_files_location,
+        dotenv_path=dotenv_path,
+        naming_strategy=naming_strategy,
+    )
+    with _READ_CACHE_LOCK:
+        _READ_CACHE[key] = (now, value)
+    return value
+
+
+def invalidate() -> None:
+    """Drop all results cached by :func:`read_cached`"""
+    with _READ_CACHE_LOCK:
+        _READ_CACHE.clear()
@@ -132,6 +132,21 @@ def test_read_default_location(tmpdir) -> None:
     assert env.DEBUG2 == "false"
 
 
+def test_read_file_name_in_subdirectory(tmpdir) -> None:
+    p_dir = tmpdir.mkdir("secrets")
+    p = p_dir.mkdir("sub").join("debug")
+    p.write("true")
+
+    assert "DEBUG" not in os.environ
+
+    @envee.environment
+    class Environment:
+        debug: str = envee.field(file_name=os.path.join("sub", "debug"))
+
+    env = envee.read(Environment, default_files_location=p_dir.realpath())
+    assert env.debug == "true"
+
+
 def test_read_file_location_and_file_name(tmpdir) -> None:
     p_dir = tmpdir.mkdir("secrets")
     p = p_dir.join("debug2")
@@ -225,6 +240,51 @@ def test_read_dotenv(tmp_path: pathlib.Path) -> None:
     assert env.multiline == "first\nsecond\n3"
 
 
+def test_read_dotenv_escaped_quotes(tmp_path: pathlib.Path) -> None:
+    dotenv_file = tmp_path / ".env"
+    dotenv_file.write_text('CONF="{\\"key\\": \\"val\\"}"\nWINPATH="C:\\\\temp"\n')
+
+    @envee.environment
+    class Environment:
+        conf: str
+        winpath: str
+
+    env = envee.read(Environment, dotenv_path=str(dotenv_file.absolute()))
+
+    assert env.conf == '{"key": "val"}'
+    assert env.winpath == "C:\\temp"
+
+
+def test_read_dotenv_cr(tmp_path: pathlib.Path) -> None:
+    dotenv_file = tmp_path / ".env"
+    dotenv_file.write_bytes(b"DEBUG=true\rNAME=hello\r")
+
+    @envee.environment
+    class Environment:
+        debug: bool
+        name: str
+
+    env = envee.read(Environment, dotenv_path=str(dotenv_file.absolute()))
+
+    assert env.debug is True
+    assert env.name == "hello"
+
+
+def test_read_dotenv_crlf(tmp_path: pathlib.Path) -> None:
+    dotenv_file = tmp_path / ".env"
+    dotenv_file.write_bytes(b"DEBUG=true\r\nNAME=hello\r\n")
+
+    @envee.environment
+    class Environment:
+        debug: bool
+        name: str
+
+    env = envee.read(Environment, dotenv_path=str(dotenv_file.absolute()))
+
+    assert env.debug is True
+    assert env.name == "hello"
+
+
 @pytest.mark.parametrize(
     "env_value,expected",
     [
@@ -303,6 +363,37 @@ def test_naming_strategy(monkeypatch, tmpdir) -> None:
     assert env.TWO == "2"
 
 
+def test_read_cached(monkeypatch) -> None:
+    @envee.environment
+    class Environment:
+        debug: str
+
+    monkeypatch.setenv("DEBUG", "true")
+    env = envee.read_cached(Environment)
+    monkeypatch.setenv("DEBUG", "false")
+
+    assert envee.read_cached(Environment) is env
+    assert env.debug == "true"
+
+    envee.invalidate()
+
+    assert envee.read_cached(Environment).debug == "false"
+
+
+def test_read_cached_expired(monkeypatch) -> None:
+    @envee.environment
+    class Environment:
+        debug: str
+
+    monkeypatch.setenv("DEBUG", "true")
+    env = envee.read_cached(Environment, ttl=0.0)
+    monkeypatch.setenv("DEBUG", "false")
+    env2 = envee.read_cached(Environment, ttl=0.0)
+
+    assert env.debug == "true"
+    assert env2.debug == "false"
+
+
 @pytest.mark.skipif(sys.version_info < (3, 10), reason="requires python3.10 or higher")
 def test_read_env_optional_new_syntax() -> None:
     @envee.environment